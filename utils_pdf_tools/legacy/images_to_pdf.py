@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-from PIL import Image
+from PIL import Image, ImageOps
 from pathlib import Path
 import sys
 import os
@@ -8,6 +8,27 @@ import os
 from notification import format_size, show_conversion_notification
 
 IMG_EXT = {".png", ".jpg", ".jpeg", ".webp", ".tif", ".tiff", ".bmp", ".heic"}
+HEIC_EXT = {".heic"}
+PHOTO_EXT = {".jpg", ".jpeg"} | HEIC_EXT  # 축소 디코딩 대상 (카메라 사진)
+
+PDF_DPI = 200  # PDF 페이지 해상도
+# 사진 한 장의 최대 픽셀 수 (A4 한 페이지를 200 DPI로 채우는 면적)
+MAX_PAGE_PIXELS = round(PDF_DPI * 8.27) * round(PDF_DPI * 11.69)
+
+# HEIC 플러그인(pillow-heif) 등록 여부 (None: 아직 확인 안 함)
+_heif_available = None
+
+def ensure_heif_support():
+    """HEIC 파일이 있을 때만 pillow-heif 플러그인을 찾아 등록"""
+    global _heif_available
+    if _heif_available is None:
+        try:
+            from pillow_heif import register_heif_opener
+            register_heif_opener()
+            _heif_available = True
+        except ImportError:
+            _heif_available = False
+    return _heif_available
 
 def iter_files(paths):
     """파일과 폴더를 구분하여 처리"""
@@ -40,6 +61,39 @@ def get_unique_filename(output_path: Path):
             return new_path
         counter += 1
 
+def load_image(img_path: Path):
+    """PDF에 넣을 크기로 이미지 로드 (축소 디코딩 + EXIF 회전 적용)"""
+    if img_path.suffix.lower() in HEIC_EXT and not ensure_heif_support():
+        raise Exception("HEIC 지원을 위해 pillow-heif 설치가 필요합니다 (pip3 install pillow-heif)")
+
+    is_photo = img_path.suffix.lower() in PHOTO_EXT
+
+    with Image.open(img_path) as im:
+        # 사진이 A4 면적보다 크면 JPEG는 1/2, 1/4, 1/8로 줄여서 디코딩
+        # (스크린샷, 스캔 PNG 등 다른 형식은 원본 해상도 유지)
+        scale = (MAX_PAGE_PIXELS / (im.width * im.height)) ** 0.5
+        if is_photo and scale < 1:
+            im.draft("RGB", (max(1, round(im.width * scale)), max(1, round(im.height * scale))))
+
+        # 카메라 사진의 EXIF 방향 정보 적용 (원본 파일과 분리된 새 이미지 반환)
+        im = ImageOps.exif_transpose(im)
+
+        # 투명 PNG 등은 RGB로 변환
+        if im.mode in ("RGBA", "LA"):
+            bg = Image.new("RGB", im.size, (255, 255, 255))
+            bg.paste(im, mask=im.split()[-1])
+            im = bg
+        elif im.mode != "RGB":
+            im = im.convert("RGB")
+
+        # 남은 크기 차이는 리샘플링으로 맞춤 (가로세로 비율 유지)
+        scale = (MAX_PAGE_PIXELS / (im.width * im.height)) ** 0.5
+        if is_photo and scale < 1:
+            size = (max(1, round(im.width * scale)), max(1, round(im.height * scale)))
+            im = im.resize(size, Image.LANCZOS)
+
+        return im
+
 def convert_images_to_pdf(image_paths, output_path: Path):
     """여러 이미지를 하나의 PDF로 변환 및 합치기"""
     if not image_paths:
@@ -51,17 +105,8 @@ def convert_images_to_pdf(image_paths, output_path: Path):
     # 모든 이미지 로드
     for img_path in sorted(image_paths):  # 파일명 순서로 정렬
         try:
-            with Image.open(img_path) as im:
-                # 투명 PNG 등은 RGB로 변환
-                if im.mode in ("RGBA", "LA"):
-                    bg = Image.new("RGB", im.size, (255, 255, 255))
-                    bg.paste(im, mask=im.split()[-1])
-                    im = bg
-                elif im.mode != "RGB":
-                    im = im.convert("RGB")
-                
-                images.append(im.copy())
-                total_size += os.path.getsize(img_path)
+            images.append(load_image(img_path))
+            total_size += os.path.getsize(img_path)
         except Exception as e:
             raise Exception(f"이미지 로드 실패 ({img_path.name}): {e}")
     
@@ -78,7 +123,7 @@ def convert_images_to_pdf(image_paths, output_path: Path):
         images[0].save(
             output_path,
             "PDF",
-            resolution=200.0,
+            resolution=float(PDF_DPI),
             save_all=True,
             append_images=images[1:] if len(images) > 1 else []
         )
@@ -3,8 +3,13 @@ from pathlib import Path
 import sys
 import os
 
+# 상위 디렉토리를 Python 경로에 추가 (notification, render_tuning 모듈 import를 위해)
+script_dir = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(script_dir))
+
 import fitz  # PyMuPDF
 from notification import format_size, show_conversion_notification
+from render_tuning import render_pages, tune
 
 PDF_EXT = {".pdf"}
 
@@ -35,20 +40,22 @@ def extract_images_from_pdf(src: Path, output_dir: Path, format="jpg"):
     zoom = 200 / 72
     mat = fitz.Matrix(zoom, zoom)
     
+    # 파일명: 원본이름_001.jpg 형식
+    if format.lower() == "png":
+        output, ext = "png", ".png"
+    else:  # 기본값: JPG
+        output, ext = "jpeg", ".jpg"
+    jobs = [(i, output_dir / (src.stem + f"_{i+1:03d}{ext}")) for i in range(page_count)]
+    
+    # 머신/문서에 맞는 워커 수, 동시 처리 페이지 수 결정
+    settings = tune(pdf_doc, mat, output)
+    pdf_doc.close()
+    
     # 각 페이지를 이미지로 저장
-    for i in range(page_count):
-        page = pdf_doc[i]
-        pix = page.get_pixmap(matrix=mat)
-        
-        # 파일명: 원본이름_001.jpg 형식
-        if format.lower() == "png":
-            dst = output_dir / (src.stem + f"_{i+1:03d}.png")
-            pix.save(str(dst), output="png")
-        else:  # 기본값: JPG
-            dst = output_dir / (src.stem + f"_{i+1:03d}.jpg")
-            pix.save(str(dst), output="jpeg", jpg_quality=92)
-        
-        # 생성된 파일 정보 수집
+    render_pages(src, jobs, zoom, settings, output)
+    
+    # 생성된 파일 정보 수집
+    for _, dst in jobs:
         file_size = os.path.getsize(dst)
         created_files.append({
             'path': dst,
@@ -56,14 +63,13 @@ def extract_images_from_pdf(src: Path, output_dir: Path, format="jpg"):
         })
         total_size += file_size
     
-    pdf_doc.close()
-    
     return {
         'success': True,
         'source': src,
         'pages': page_count,
         'files': created_files,
-        'total_size': total_size
+        'total_size': total_size,
+        'settings': settings
     }
 
 def main(argv):
@@ -95,6 +101,8 @@ def main(argv):
             print(f"\n✓ 성공: {src.name}")
             print(f"  원본: {src}")
             print(f"  페이지 수: {result['pages']}페이지")
+            print(f"  렌더링 설정: 워커 {result['settings']['workers']}개, "
+                  f"동시 {result['settings']['pages_in_flight']}페이지")
             print(f"  출력 폴더: {output_dir}")
             print(f"  생성된 파일:")
             for file_info in result['files']:
@@ -9,6 +9,7 @@ sys.path.insert(0, str(script_dir))
 
 import fitz  # PyMuPDF
 from notification import format_size, show_conversion_notification
+from render_tuning import render_pages, tune
 
 PDF_EXT = {".pdf"}
 
@@ -33,48 +34,34 @@ def convert_one(src: Path):
     total_size = 0
     output_dir = None
     
+    # DPI 200에 해당하는 확대율 (72 DPI 기준)
+    zoom = 200 / 72
+    mat = fitz.Matrix(zoom, zoom)
+    
     # 단일 페이지: 원본과 같은 폴더에 저장
     # 여러 페이지: {원본명}_images 폴더에 저장
     if page_count == 1:
-        # 단일 페이지인 경우
-        dst = src.parent / (src.stem + ".jpg")
-        page = pdf_doc[0]
-        # DPI 200에 해당하는 확대율 (72 DPI 기준)
-        zoom = 200 / 72
-        mat = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=mat)
-        pix.save(str(dst), output="jpeg", jpg_quality=92)
-        
+        jobs = [(0, src.parent / (src.stem + ".jpg"))]
+    else:
+        output_dir = src.parent / (src.stem + "_images")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        # 파일명: 원본이름_001.jpg 형식
+        jobs = [(i, output_dir / (src.stem + f"_{i+1:03d}.jpg")) for i in range(page_count)]
+    
+    # 머신/문서에 맞는 워커 수, 동시 처리 페이지 수 결정
+    settings = tune(pdf_doc, mat)
+    pdf_doc.close()
+    
+    render_pages(src, jobs, zoom, settings)
+    
+    # 생성된 파일 정보 수집
+    for _, dst in jobs:
         file_size = os.path.getsize(dst)
         created_files.append({
             'path': dst,
             'size': file_size
         })
         total_size += file_size
-    else:
-        # 여러 페이지인 경우: 폴더에 저장
-        output_dir = src.parent / (src.stem + "_images")
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        zoom = 200 / 72
-        mat = fitz.Matrix(zoom, zoom)
-        
-        for i in range(page_count):
-            # 파일명: 원본이름_001.jpg 형식
-            dst = output_dir / (src.stem + f"_{i+1:03d}.jpg")
-            page = pdf_doc[i]
-            pix = page.get_pixmap(matrix=mat)
-            pix.save(str(dst), output="jpeg", jpg_quality=92)
-            
-            # 생성된 파일 정보 수집
-            file_size = os.path.getsize(dst)
-            created_files.append({
-                'path': dst,
-                'size': file_size
-            })
-            total_size += file_size
-    
-    pdf_doc.close()
     
     return {
         'success': True,
@@ -82,7 +69,8 @@ def convert_one(src: Path):
         'pages': page_count,
         'files': created_files,
         'total_size': total_size,
-        'output_dir': output_dir if page_count > 1 else None
+        'output_dir': output_dir if page_count > 1 else None,
+        'settings': settings
     }
 
 def main(argv):
@@ -166,6 +154,8 @@ def main(argv):
             print(f"\n✓ 성공: {src.name}")
             print(f"  원본: {src}")
             print(f"  페이지 수: {result['pages']}페이지")
+            print(f"  렌더링 설정: 워커 {result['settings']['workers']}개, "
+                  f"동시 {result['settings']['pages_in_flight']}페이지")
             if result['output_dir']:
                 print(f"  출력 폴더: {result['output_dir']}")
             print(f"  생성된 파일:")
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""PDF 렌더링 자동 튜닝 모듈
+
+문서의 샘플 페이지를 두 가지 축소 배율로 렌더링하고 인코딩해서
+페이지당 고정 비용과 픽셀당 비용(렌더링 + 이미지 인코딩)을 측정한 뒤,
+현재 사용 가능한 메모리 안에서 워커 수 / 동시 처리 페이지 수를 결정합니다.
+결정된 설정으로 페이지를 렌더링하는 프로세스 풀도 제공합니다.
+"""
+import os
+import platform
+import re
+import statistics
+import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import fitz  # PyMuPDF
+
+SAMPLE_PAGES = 3  # 측정에 사용할 샘플 페이지 수
+SAMPLE_MAX_PIXELS = 1_000_000  # 샘플 렌더링 최대 픽셀 수 (큰 페이지는 축소해서 측정)
+BYTES_PER_PIXEL = 3  # get_pixmap 기본값(RGB, 알파 없음)의 픽셀당 바이트 수
+MEMORY_BUDGET_RATIO = 0.5  # 전체 RAM 중 렌더링에 사용할 최대 비율
+WORKER_OVERHEAD = 96 * 1024 * 1024  # 워커 프로세스당 기본 메모리 (인터프리터 + MuPDF)
+MIN_SECONDS_PER_WORKER = 0.5  # 워커 하나가 맡을 최소 작업량 (프로세스 기동 비용 상쇄용)
+DEFAULT_MEMORY = 8 * 1024 ** 3  # 메모리 조회 실패 시 가정값
+
+
+def get_total_memory():
+    """물리 메모리 크기(바이트) 조회"""
+    try:
+        if platform.system() == "Darwin":
+            out = subprocess.run(
+                ["sysctl", "-n", "hw.memsize"],
+                check=True, capture_output=True, text=True
+            )
+            return int(out.stdout.strip())
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except Exception:
+        return DEFAULT_MEMORY
+
+
+def get_available_memory(total_memory):
+    """현재 사용 가능한 메모리(바이트) 조회 (실행할 때마다 새로 조회)"""
+    try:
+        if platform.system() == "Darwin":
+            out = subprocess.run(
+                ["vm_stat"], check=True, capture_output=True, text=True
+            ).stdout
+            page_size = int(re.search(r"page size of (\d+) bytes", out).group(1))
+            pages = 0
+            for name in ("Pages free", "Pages inactive", "Pages speculative"):
+                match = re.search(rf"{name}:\s+(\d+)", out)
+                if match:
+                    pages += int(match.group(1))
+            return pages * page_size
+        try:
+            with open("/proc/meminfo", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_AVPHYS_PAGES")
+    except Exception:
+        return int(total_memory * MEMORY_BUDGET_RATIO)
+
+
+def _timed_render(page, matrix, scale, output=None):
+    """축소 배율로 렌더링(필요하면 인코딩까지)하고 (렌더링 시간, 인코딩 시간, 픽셀 수) 반환"""
+    start = time.perf_counter()
+    pix = page.get_pixmap(matrix=matrix * fitz.Matrix(scale, scale))
+    render_time = time.perf_counter() - start
+
+    encode_time = 0.0
+    if output:
+        start = time.perf_counter()
+        if output == "png":
+            pix.tobytes("png")
+        else:
+            pix.tobytes("jpeg", jpg_quality=92)
+        encode_time = time.perf_counter() - start
+
+    return render_time, encode_time, pix.width * pix.height
+
+
+def measure_pages(pdf_doc, matrix, counts, output="jpeg", sample=SAMPLE_PAGES):
+    """샘플 페이지로 이 문서의 페이지당 고정 비용과 픽셀당 비용(초) 측정
+
+    큰 페이지(포스터, 도면 등)를 측정 단계에서 원본 크기로 렌더링하지 않도록
+    샘플은 SAMPLE_MAX_PIXELS 이하의 두 가지 배율로 렌더링하고,
+    두 측정값의 차이로 페이지 해석 같은 고정 비용과 픽셀에 비례하는 비용을 분리합니다.
+    인코딩 비용은 픽셀에 비례한다고 보고 큰 쪽 샘플로 측정합니다.
+    """
+    page_count = len(counts)
+    if page_count <= sample:
+        indices = list(range(page_count))
+    else:
+        # 문서 앞/중간/뒤에서 고르게 선택
+        indices = sorted({round(i * (page_count - 1) / (sample - 1)) for i in range(sample)})
+
+    fixed_costs = []
+    pixel_costs = []
+    for i in indices:
+        if not counts[i]:
+            continue
+        page = pdf_doc[i]
+        high = min(1.0, (SAMPLE_MAX_PIXELS / counts[i]) ** 0.5)
+        low = high / 2
+
+        # 첫 렌더링은 폰트/이미지 로딩 같은 페이지당 1회 비용을 포함
+        cold, _, low_pixels = _timed_render(page, matrix, low)
+        warm, _, _ = _timed_render(page, matrix, low)
+        render_high, encode_high, high_pixels = _timed_render(page, matrix, high, output)
+        if high_pixels <= low_pixels:
+            continue
+
+        render_per_pixel = max(0.0, (render_high - warm) / (high_pixels - low_pixels))
+        fixed_costs.append(max(0.0, cold - render_per_pixel * low_pixels))
+        pixel_costs.append(render_per_pixel + encode_high / high_pixels)
+
+    if not pixel_costs:
+        return 0.0, 0.0
+    return statistics.median(fixed_costs), statistics.median(pixel_costs)
+
+
+def page_pixel_counts(pdf_doc, matrix):
+    """각 페이지를 주어진 확대율로 렌더링했을 때의 픽셀 수 (실제 렌더링 없이 계산)"""
+    counts = []
+    for page in pdf_doc:
+        irect = (page.rect * matrix).irect
+        counts.append(irect.width * irect.height)
+    return counts
+
+
+def tune(pdf_doc, matrix, output="jpeg"):
+    """문서와 머신에 맞는 렌더링 설정 결정
+
+    Returns:
+        dict: workers(워커 프로세스 수), pages_in_flight(동시에 제출할 페이지 수)
+    """
+    counts = page_pixel_counts(pdf_doc, matrix)
+    page_count = len(counts)
+    if page_count == 0:
+        return {'workers': 1, 'pages_in_flight': 1}
+
+    # 페이지마다 고정 비용 + 픽셀 수에 비례하는 렌더링/인코딩 비용
+    fixed_cost, pixel_cost = measure_pages(pdf_doc, matrix, counts, output)
+    est_seconds = fixed_cost * page_count + pixel_cost * sum(counts)
+
+    # 작업량이 적으면 프로세스 기동 비용이 더 크므로 워커를 줄임
+    workers = min(
+        os.cpu_count() or 1,
+        page_count,
+        max(1, int(est_seconds / MIN_SECONDS_PER_WORKER)),
+    )
+
+    # 지금 사용 가능한 메모리 기준 (전체 RAM의 MEMORY_BUDGET_RATIO를 넘지 않음)
+    total_memory = get_total_memory()
+    budget = min(
+        get_available_memory(total_memory),
+        int(total_memory * MEMORY_BUDGET_RATIO),
+    )
+
+    # 워커는 한 번에 한 페이지의 픽스맵만 들고 있고 인코딩은 줄 단위로 스트리밍되므로,
+    # 워커마다 가장 큰 페이지 픽스맵이 메모리 예산 안에 들어갈 때까지 줄임
+    max_page_bytes = max(counts) * BYTES_PER_PIXEL
+    while workers > 1 and workers * (WORKER_OVERHEAD + max_page_bytes) > budget:
+        workers -= 1
+
+    return {
+        'workers': workers,
+        # 워커가 1개면 풀 없이 순차 처리하므로 동시 처리 페이지도 1개
+        'pages_in_flight': min(page_count, workers * 2) if workers > 1 else 1,
+    }
+
+
+# 워커 프로세스에서 열어 둔 PDF (페이지마다 다시 열지 않도록)
+_worker_doc = None
+
+
+def _init_worker(src_str):
+    global _worker_doc
+    _worker_doc = fitz.open(src_str)
+
+
+def _render_job(index, dst_str, zoom, output):
+    """워커에서 한 페이지를 렌더링하여 이미지 파일로 저장"""
+    mat = fitz.Matrix(zoom, zoom)
+    pix = _worker_doc[index].get_pixmap(matrix=mat)
+    if output == "png":
+        pix.save(dst_str, output="png")
+    else:
+        pix.save(dst_str, output="jpeg", jpg_quality=92)
+
+
+def render_pages(src, jobs, zoom, settings, output="jpeg"):
+    """페이지들을 튜닝된 워커 수와 동시 처리 페이지 수로 렌더링"""
+    global _worker_doc
+    if settings['workers'] <= 1:
+        # 워커 1개면 프로세스를 띄우지 않고 현재 프로세스에서 처리
+        _init_worker(str(src))
+        try:
+            for index, dst in jobs:
+                _render_job(index, str(dst), zoom, output)
+        finally:
+            _worker_doc.close()
+            _worker_doc = None
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=settings['workers'],
+        initializer=_init_worker,
+        initargs=(str(src),)
+    ) as pool:
+        pending = set()
+        for index, dst in jobs:
+            # 동시에 제출된 페이지 수 제한
+            if len(pending) >= settings['pages_in_flight']:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+            pending.add(pool.submit(_render_job, index, str(dst), zoom, output))
+        for future in pending:
+            future.result()